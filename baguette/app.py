@@ -139,6 +139,11 @@ class Baguette:
             [ErrorMiddleware, *middlewares, DefaultHeadersMiddleware]
         )
 
+        self._asgi_handlers = {
+            "http": self._handle_http,
+            "lifespan": self._handle_lifespan,
+        }
+
     def __getattr__(self, name):
         return getattr(self.config, name)
 
@@ -148,12 +153,7 @@ class Baguette:
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Entry point of the ASGI application."""
 
-        asgi_handlers = {
-            "http": self._handle_http,
-            "lifespan": self._handle_lifespan,
-        }
-
-        asgi_handler = asgi_handlers.get(scope["type"])
+        asgi_handler = self._asgi_handlers.get(scope["type"])
         if asgi_handler is None:
             raise NotImplementedError(
                 "{0!r} scope is not supported".format(scope["type"])
@@ -271,9 +271,7 @@ class Baguette:
             raise BadRequest(description="Failed to convert URL parameters")
         kwargs["request"] = request
         if not route.handler_is_class:
-            kwargs = {
-                k: v for k, v in kwargs.items() if k in route.handler_kwargs
-            }
+            kwargs = {k: kwargs[k] for k in route.handler_kwargs if k in kwargs}
 
         result: Result = await handler(**kwargs)
         return make_response(result)
@@ -564,6 +562,8 @@ class Baguette:
             loop: Optional ``"auto"``, ``"asyncio"`` or ``"uvloop"``
                 Event loop implementation. The uvloop implementation provides
                 greater performance, but is not compatible with Windows or PyPy.
+                ``"auto"`` uses uvloop when it is installed, which is the case
+                when installing baguette with the ``uvicorn`` extra.
                 Default: ``"auto"``
 
             http: Optional ``"auto"``, ``"h11"`` or ``"httptools"``
@@ -210,10 +210,10 @@ class IntegerConverter(Converter):
                 is higher then :attr:`max`.
         """
 
-        if not self.signed and (string.strip()[0] in "+-"):
+        sign = string.lstrip()[:1]
+        if not self.signed and sign in ("+", "-"):
             raise ValueError(
-                "Expected unsigned integer. Got integer starting with "
-                + string.strip()[0]
+                "Expected unsigned integer. Got integer starting with " + sign
             )
 
         integer = int(string)
@@ -328,10 +328,10 @@ class FloatConverter(Converter):
                 is ``nan``.
         """
 
-        if not self.signed and (string.strip()[0] in "+-"):
+        sign = string.lstrip()[:1]
+        if not self.signed and sign in ("+", "-"):
             raise ValueError(
-                "Expected unsigned float. Got float starting with "
-                + string.strip()[0]
+                "Expected unsigned float. Got float starting with " + sign
             )
 
         number = float(string)
@@ -10,6 +10,8 @@ from .utils import split_on_first, to_str
 
 
 class Field:
+    __slots__ = ("name", "values", "value", "is_file")
+
     def __init__(
         self,
         name: str,
@@ -18,10 +20,7 @@ class Field:
     ):
         self.name = name
         self.values = [to_str(value) for value in values]
-        if len(self.values) > 0:
-            self.value = self.values[0]
-        else:
-            self.value = None
+        self.value = self.values[0] if self.values else None
 
         self.is_file = False
 
@@ -39,6 +38,8 @@ class Field:
 
 
 class FileField(Field):
+    __slots__ = ("filename", "content", "content_type", "encoding")
+
     def __init__(
         self,
         name: str,
@@ -56,10 +57,10 @@ class FileField(Field):
         self.encoding = encoding
 
         if not self.content_type:
+            # browsers send an empty filename when no file was selected
             self.content_type = (
-                mimetypes.guess_type(self.filename)[0]
-                or "application/octet-stream"
-            )
+                self.filename and mimetypes.guess_type(self.filename)[0]
+            ) or "application/octet-stream"
 
     @property
     def text(self) -> StrOrBytes:
@@ -149,7 +150,9 @@ class MultipartForm(Form):
     ) -> "MultipartForm":
         fields: typing.Dict[str, Field] = {}
         files: typing.Dict[str, FileField] = {}
-        for part in body.strip(b"\r\n").split(b"".join((b"--", boundary))):
+        # each part is stripped below, so the whole body doesn't need to be
+        # stripped (and copied) first
+        for part in body.split(b"--" + boundary):
             part = part.strip(b"\r\n")
             if part in (b"", b"--"):  # ignore start and end parts
                 continue
@@ -159,13 +162,13 @@ class MultipartForm(Form):
             kwargs = parse_header(headers["content-disposition"])[1]
 
             name = kwargs["name"]
-            is_file = "filename" in kwargs
             filename = kwargs.get("filename", None)
 
-            if name in fields and not fields[name].is_file:
-                fields[name].values.append(value.decode(encoding))
+            field = fields.get(name)
+            if field is not None and not field.is_file:
+                field.values.append(value.decode(encoding))
             else:
-                if is_file:
+                if filename is not None:
                     fields[name] = files[name] = FileField(
                         name,
                         value,
@@ -1,3 +1,4 @@
+import functools
 import itertools
 import typing
 from collections.abc import Mapping, Sequence
@@ -6,6 +7,12 @@ from .types import HeadersType
 from .utils import to_str
 
 
+@functools.lru_cache(maxsize=256)
+def _normalize_name(name) -> str:
+    # the same few header names are normalized over and over again
+    return to_str(name, encoding="ascii").lower().strip()
+
+
 class Headers:
     """Headers implementation for handling :class:`str` or :class:`bytes` names
     and values.
@@ -15,6 +22,8 @@ class Headers:
         a :class:`dict`.
     """
 
+    __slots__ = ("_headers",)
+
     def __init__(self, *args, **kwargs):
         self._headers: typing.Dict[str, str] = {}
 
@@ -40,8 +49,7 @@ class Headers:
                 ``default``'s value.
         """
 
-        name = to_str(name, encoding="ascii")
-        return self._headers.get(name.lower().strip(), default)
+        return self._headers.get(_normalize_name(name), default)
 
     def keys(self):
         """Returns an iterator over the headers names.
@@ -91,41 +99,36 @@ class Headers:
         return len(self._headers)
 
     def __getitem__(self, name):
-        name = to_str(name, encoding="ascii")
-        return self._headers[name.lower().strip()]
+        return self._headers[_normalize_name(name)]
 
     def __setitem__(self, name, value):
-        name = to_str(name, encoding="ascii")
         value = to_str(value, encoding="ascii")
-        self._headers[name.lower().strip()] = value.strip()
+        self._headers[_normalize_name(name)] = value.strip()
 
     def __delitem__(self, name):
-        name = to_str(name, encoding="ascii")
-        del self._headers[name.lower().strip()]
+        del self._headers[_normalize_name(name)]
 
     def __contains__(self, name):
-        name = to_str(name, encoding="ascii")
-        return name.lower().strip() in self._headers
+        return _normalize_name(name) in self._headers
 
     def __add__(self, other: HeadersType):
-        new = Headers(**self)
+        new = Headers()
+        # names and values are already normalized, no need to do it again
+        new._headers = self._headers.copy()
         new += other
         return new
 
     def __iadd__(self, other: HeadersType):
-        other = make_headers(other)
-        for name, value in other:
-            self._headers[name] = value
+        if not isinstance(other, Headers):
+            other = make_headers(other)
+        self._headers.update(other._headers)
         return self
 
     def __eq__(self, other: HeadersType) -> bool:
-        other = make_headers(other)
-        if len(self) != len(other):
-            return False
-        for name, value in self:
-            if other[name] != value:
-                return False
-        return True
+        if not isinstance(other, Headers):
+            other = make_headers(other)
+        # both sides are normalized, so the dicts can be compared directly
+        return self._headers == other._headers
 
 
 def make_headers(headers: HeadersType = None) -> Headers:
@@ -70,10 +70,12 @@ class HTTPException(Exception):
     def __init__(
         self, status_code: int, name: str = None, description: str = None
     ):
-        if name is None:
-            name = http.HTTPStatus(status_code).phrase
-        if description is None:
-            description = http.HTTPStatus(status_code).description
+        if name is None or description is None:
+            status = http.HTTPStatus(status_code)
+            if name is None:
+                name = status.phrase
+            if description is None:
+                description = status.description
         self.status_code = status_code
         self.name = name
         self.description = description
@@ -1,3 +1,4 @@
+import logging
 import traceback
 
 from ..httpexceptions import HTTPException, InternalServerError
@@ -5,6 +6,8 @@ from ..middleware import Middleware
 from ..request import Request
 from ..responses import Response, make_error_response
 
+logger = logging.getLogger(__name__)
+
 
 class ErrorMiddleware(Middleware):
     """Middleware to handle errors in request handling. Can be
@@ -31,7 +34,7 @@ class ErrorMiddleware(Middleware):
             )
 
         except Exception as exception:
-            traceback.print_exc()
+            logger.exception("Error in request handling")
             http_exception = InternalServerError()
             return make_error_response(
                 http_exception,
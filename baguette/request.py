@@ -45,9 +45,6 @@ class Request:
         asgi_version: :class:`str`
             The ASGI specification version used.
 
-        headers: :class:`Headers`
-            The HTTP headers included in the request.
-
         method: :class:`str`
             The HTTP method name, uppercased.
 
@@ -60,10 +57,6 @@ class Request:
             decoded into characters.
             ``"/"`` at the end of the path is striped.
 
-        querystring: :class:`dict` with :class:`str` keys and \
-        :class:`list` of :class:`str` values
-            URL querystring decoded by :func:`urllib.parse.parse_qs`.
-
         server: :class:`tuple` of (:class:`str`, :class:`int`)
             Adress and port of the server.
             The first element can be the path to the UNIX socket running
@@ -72,12 +65,6 @@ class Request:
         client: :class:`tuple` of (:class:`str`, :class:`int`)
             Adress and port of the client.
             The adress can be either IPv4 or IPv6.
-
-        content_type: :class:`str`
-            Content type of the response body.
-
-        encoding: :class:`str`
-            Encoding of the response body.
     """
 
     def __init__(self, app: ASGIApp, scope: Scope, receive: Receive):
@@ -88,30 +75,91 @@ class Request:
         self.http_version: str = scope["http_version"]
         self.asgi_version: str = scope["asgi"]["version"]
 
-        self.headers: Headers = Headers(*scope["headers"])
         self.method: str = scope["method"].upper()
         self.scheme: str = scope.get("scheme", "http")
         self.root_path: str = scope.get("root_path", "")
-        self.path: str = scope["path"].rstrip("/") or "/"
-        self.querystring: typing.Dict[str, typing.List[str]] = parse_qs(
-            scope["query_string"].decode("ascii")
-        )
+        self.path: str = scope["path"]
+        if self.path.endswith("/"):
+            self.path = self.path.rstrip("/") or "/"
 
         self.server: typing.Tuple[str, int] = scope["server"]
         self.client: typing.Tuple[str, int] = scope["client"]
 
-        # common headers
-        self.content_type: str = parse_header(
-            self.headers.get("content-type", "")
-        )[0]
-        self.encoding: str = get_encoding_from_headers(self.headers) or "utf-8"
-
         # cached
+        self._querystring: typing.Dict[str, typing.List[str]] = None
+        self._headers: Headers = None
+        self._content_type: str = None
+        self._encoding: str = None
         self._raw_body: bytes = None
         self._body: str = None
         self._json: JSONType = None
         self._form: Form = None
 
+    @property
+    def querystring(self) -> typing.Dict[str, typing.List[str]]:
+        """URL querystring decoded by :func:`urllib.parse.parse_qs`.
+
+        .. note::
+            The querystring is only parsed the first time it is accessed.
+        """
+
+        if self._querystring is None:
+            query_string = self._scope["query_string"]
+            self._querystring = (
+                parse_qs(query_string.decode("ascii")) if query_string else {}
+            )
+        return self._querystring
+
+    @querystring.setter
+    def querystring(self, querystring: typing.Dict[str, typing.List[str]]):
+        self._querystring = querystring
+
+    # --------------------------------------------------------------------------
+    # Headers
+
+    @property
+    def headers(self) -> Headers:
+        """The HTTP headers included in the request.
+
+        .. note::
+            The headers are only parsed from the ASGI scope the first time
+            they are accessed.
+        """
+
+        if self._headers is None:
+            self._headers = Headers(*self._scope["headers"])
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers: Headers):
+        self._headers = headers
+
+    @property
+    def content_type(self) -> str:
+        """Content type of the request body."""
+
+        if self._content_type is None:
+            self._content_type = parse_header(
+                self.headers.get("content-type", "")
+            )[0]
+        return self._content_type
+
+    @content_type.setter
+    def content_type(self, content_type: str):
+        self._content_type = content_type
+
+    @property
+    def encoding(self) -> str:
+        """Encoding of the request body."""
+
+        if self._encoding is None:
+            self._encoding = get_encoding_from_headers(self.headers) or "utf-8"
+        return self._encoding
+
+    @encoding.setter
+    def encoding(self, encoding: str):
+        self._encoding = encoding
+
     # --------------------------------------------------------------------------
     # Body methods
 
@@ -128,7 +176,8 @@ class Request:
         if self._raw_body is not None:
             return self._raw_body
 
-        body = b""
+        # bytes concatenation copies the whole body for each chunk
+        body = bytearray()
         more_body = True
 
         while more_body:
@@ -136,7 +185,7 @@ class Request:
             body += message.get("body", b"")
             more_body = message.get("more_body", False)
 
-        self._raw_body = body
+        self._raw_body = bytes(body)
         return self._raw_body
 
     async def body(self) -> str:
@@ -10,7 +10,7 @@ from .headers import Headers, make_headers
 from .httpexceptions import HTTPException, NotFound
 from .json import UJSONEncoder
 from .types import HeadersType, Result, Send, StrOrBytes
-from .utils import safe_join, to_bytes, to_str
+from .utils import safe_join, to_str
 
 HTML_TAG_REGEX = re.compile(r"<\s*\w+[^>]*>.*?<\s*/\s*\w+\s*>")
 
@@ -64,8 +64,17 @@ class Response:
 
     @body.setter
     def body(self, body: StrOrBytes):
-        self._raw_body: bytes = to_bytes(body, encoding=self.CHARSET)
-        self._body: str = to_str(body, encoding=self.CHARSET)
+        if isinstance(body, str):
+            self._raw_body: bytes = body.encode(self.CHARSET)
+            self._body: str = body
+        elif isinstance(body, bytes):
+            self._raw_body: bytes = body
+            self._body: str = body.decode(self.CHARSET)
+        else:
+            raise TypeError(
+                "body must be of type str or bytes. Got: "
+                + body.__class__.__name__
+            )
 
     @property
     def raw_body(self) -> bytes:
@@ -80,8 +89,7 @@ class Response:
 
     @raw_body.setter
     def raw_body(self, body: StrOrBytes):
-        self._raw_body: bytes = to_bytes(body, encoding=self.CHARSET)
-        self._body: str = to_str(body, encoding=self.CHARSET)
+        self.body = body
 
     async def _send(self, send: Send):
         """Sends the response."""
@@ -139,8 +147,10 @@ class JSONResponse(Response):
         status_code: int = 200,
         headers: typing.Optional[HeadersType] = None,
     ):
-        self.json = data
-        super().__init__(self.body, status_code, headers)
+        super().__init__(
+            json.dumps(data, cls=self.JSON_ENCODER), status_code, headers
+        )
+        self._json = data
         self.headers["content-type"] = "application/json"
 
     @property
@@ -404,19 +414,17 @@ def make_response(result: Result) -> Response:
     elif isinstance(status_code_or_headers, (list, dict, Headers)):
         headers = status_code_or_headers
 
-    headers = make_headers(headers)
-
-    if not isinstance(body, (list, dict, str, bytes)) and body is not None:
-        body = str(body)
-
     if isinstance(body, (list, dict)):
         response = JSONResponse(body, status_code or 200, headers)
-    elif isinstance(body, (str, bytes)):
+    elif body is not None:
+        if not isinstance(body, (str, bytes)):
+            body = str(body)
+
         if HTML_TAG_REGEX.search(to_str(body, encoding="ascii")) is not None:
             response = HTMLResponse(body, status_code or 200, headers)
         else:
             response = PlainTextResponse(body, status_code or 200, headers)
-    elif body is None:
+    else:
         response = EmptyResponse(status_code or 204, headers)
         # print(
         #     RuntimeWarning(
@@ -1,6 +1,8 @@
+import heapq
 import inspect
 import re
 import typing
+import weakref
 
 import cachetools
 
@@ -28,6 +30,21 @@ class Route:
         "float": FloatConverter,
     }
 
+    __slots__ = (
+        "path",
+        "name",
+        "handler",
+        "methods",
+        "defaults",
+        "handler_kwargs",
+        "handler_is_class",
+        "converters",
+        "index_converters",
+        "regex",
+        "_converted",
+        "_routers",
+    )
+
     def __init__(
         self,
         path: str,
@@ -62,6 +79,12 @@ class Route:
         self.build_converters()
 
         self.regex = re.compile("")
+        # routers that indexed this route, they need to reindex it when its
+        # regex changes
+        self._routers: typing.MutableSet["Router"] = weakref.WeakSet()
+        self._converted: typing.MutableMapping[
+            str, typing.Dict[str, typing.Any]
+        ] = cachetools.LRUCache(128)
         self.build_regex()
 
     def build_converters(self):
@@ -119,41 +142,190 @@ class Route:
         regex += r"\/?"
 
         self.regex = re.compile(regex)
+        self._converted.clear()  # converted with the previous regex
+        for router in self._routers:
+            router._invalidate()
 
     def match(self, path: str) -> bool:
         return self.regex.fullmatch(path if path.endswith("/") else path + "/")
 
     def convert(self, path: str) -> typing.Dict[str, typing.Any]:
+        # the defaults are merged on every call so that changing them doesn't
+        # require clearing the cache
+        parameters = self._converted.get(path)
+        if parameters is None:
+            parameters = self._convert_parameters(path)
+            self._converted[path] = parameters
+
         kwargs = self.defaults.copy()
+        kwargs.update(parameters)
+        return kwargs
+
+    def _convert_parameters(self, path: str) -> typing.Dict[str, typing.Any]:
         match = self.regex.fullmatch(path if path.endswith("/") else path + "/")
 
         if match is None:
             raise ValueError("Path doesn't match router path")
 
-        parameters = match.groupdict()
+        parameters = {}
 
-        for name, value in parameters.items():
+        for name, value in match.groupdict().items():
             if value is None:
-                if name in kwargs:
+                if name in self.defaults:
                     continue
 
             converter = self.converters[name]
             try:
-                kwargs[name] = converter.convert(value)
+                parameters[name] = converter.convert(value)
             except ValueError as conversion_error:
                 raise ValueError(
                     f"Failed to convert {name} argument: "
                     + str(conversion_error)
                 ) from conversion_error
 
-        return kwargs
+        return parameters
+
+
+class _RouteList(list):
+    """List of routes that invalidates the index of its router when it is
+    changed."""
+
+    def __init__(self, router: "Router", routes: typing.Iterable[Route]):
+        super().__init__(routes)
+        self._router = router
+
+
+def _invalidating(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._router._invalidate()
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_RouteList, _name, _invalidating(_name))
 
 
 class Router:
+    PARAM_GROUP_REGEX = re.compile(r"\(\?P<\w+>")
+
     def __init__(self, routes: typing.Optional[typing.List[Route]] = None):
-        self.routes: typing.List[Route] = routes or []
         self._cache: typing.Mapping[str, Route] = cachetools.LFUCache(256)
 
+        # routes without parameters are indexed by their normalized path so
+        # they don't need to go through a regex match, the index of the route
+        # is kept to preserve the registration order when matching
+        self._static_routes: typing.Dict[
+            str, typing.List[typing.Tuple[int, Route]]
+        ] = {}
+        self._dynamic_routes: typing.List[typing.Tuple[int, Route]] = []
+        self._dynamic_regex: typing.Optional[typing.Pattern] = None
+
+        # routes and their regexes can be changed directly, the index is
+        # rebuilt on the next lookup after they change
+        self._index_is_stale = True
+        self.routes = routes or []
+
+    @property
+    def routes(self) -> typing.List[Route]:
+        return self._routes
+
+    @routes.setter
+    def routes(self, routes: typing.Iterable[Route]):
+        self._routes = _RouteList(self, routes)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._index_is_stale = True
+        # the cached lookups may point to changed or removed routes
+        self._cache.clear()
+
+    def _update_index(self):
+        self._static_routes = {}
+        self._dynamic_routes = []
+        for index, route in enumerate(self.routes):
+            self._index_route(index, route)
+            route._routers.add(self)
+        self._dynamic_regex = (
+            self._build_dynamic_regex() if self._dynamic_routes else None
+        )
+        self._index_is_stale = False
+
+    def _index_route(self, index: int, route: Route):
+        if route.index_converters:
+            self._dynamic_routes.append((index, route))
+            return
+
+        path = "/" + route.path.strip("/") + "/"
+        self._static_routes.setdefault(path, []).append((index, route))
+        if path == "//":
+            # the index route also matches an empty path
+            self._static_routes.setdefault("/", []).append((index, route))
+
+    def _matching_routes(self, path: str) -> typing.Iterator[Route]:
+        if not path.endswith("/"):
+            path += "/"
+
+        static_routes = self._static_routes.get(path, [])
+        dynamic_routes = self._matching_dynamic_routes(path)
+        for _, route in heapq.merge(
+            static_routes, dynamic_routes, key=lambda item: item[0]
+        ):
+            yield route
+
+    def _build_dynamic_regex(self) -> typing.Pattern:
+        # one named alternative per route, the parameter groups are made
+        # non-capturing as different routes can use the same parameter name
+        return re.compile(
+            "|".join(
+                "(?P<_r{}>{})".format(
+                    position,
+                    self.PARAM_GROUP_REGEX.sub("(?:", route.regex.pattern),
+                )
+                for position, (_, route) in enumerate(self._dynamic_routes)
+            )
+        )
+
+    def _matching_dynamic_routes(
+        self, path: str
+    ) -> typing.Iterator[typing.Tuple[int, Route]]:
+        if self._dynamic_regex is None:
+            return
+
+        # alternatives are tried in order, so this is the first matching route
+        match = self._dynamic_regex.fullmatch(path)
+        if match is None:
+            return
+
+        # the alternative groups wrap everything else, so they are always the
+        # last closed group, even if a converter regex has its own groups
+        first = int(match.lastgroup[2:])
+        yield self._dynamic_routes[first]
+
+        # the following routes are only needed if the first one doesn't
+        # accept the request method
+        for index, route in self._dynamic_routes[first + 1 :]:  # noqa: E203
+            if route.regex.fullmatch(path):
+                yield index, route
+
     def add_route(
         self,
         handler: Handler,
@@ -175,11 +347,12 @@ class Router:
     def get(self, path: str, method: str) -> Route:
         route = self._cache.get(method + " " + path)
         if route is None:
-            for possible_route in self.routes:
-                if possible_route.match(path):
-                    route = possible_route
-                    if method not in route.methods:
-                        continue
+            if self._index_is_stale:
+                self._update_index()
+
+            for possible_route in self._matching_routes(path):
+                route = possible_route
+                if method in route.methods:
                     break
 
             if route is None:
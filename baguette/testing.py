@@ -1,3 +1,4 @@
+import collections
 import typing
 from collections.abc import Mapping, Sequence
 from urllib.parse import urlencode
@@ -326,11 +327,11 @@ class TestClient:
     def _prepare_querystring(
         self, params: typing.Optional[ParamsType] = None
     ) -> str:
-        query = {}
-
         if params is None or isinstance(params, str):
             return params or ""
 
+        query = collections.defaultdict(list)
+
         if isinstance(params, Mapping):
             params = list(params.items())
 
@@ -340,19 +341,14 @@ class TestClient:
 
             for name, value in params:
                 if isinstance(value, str):
-                    values = [value]
-                elif isinstance(value, Sequence):
-                    if not all(isinstance(v, str) for v in value):
-                        raise ValueError("Incorrect param type")
-                    values = list(value)
+                    query[name].append(value)
+                elif isinstance(value, Sequence) and all(
+                    isinstance(v, str) for v in value
+                ):
+                    query[name].extend(value)
                 else:
                     raise ValueError("Incorrect param type")
 
-                if name in query:
-                    query[name].extend(values)
-                else:
-                    query[name] = values
-
         else:
             raise ValueError("Incorrect param type")
 
@@ -1,11 +1,17 @@
-import cgi
+import functools
+import importlib
 import os
 import pathlib
+import re
 import typing
 
 from .httpexceptions import NotFound
 from .types import FilePath, StrOrBytes
 
+# parameters of a header, the semicolons inside quoted strings don't separate
+# them, the first one is the header value itself
+HEADER_PARAM_REGEX = re.compile(r';((?:"(?:\\.|[^"\\])*(?:"|$)|[^;"])*)')
+
 
 def get_encoding_from_content_type(content_type):
     """Returns encodings from given Content-Type Header."""
@@ -13,10 +19,16 @@ def get_encoding_from_content_type(content_type):
     if not content_type:
         return None
 
-    content_type, params = cgi.parse_header(content_type)
+    content_type, *params = HEADER_PARAM_REGEX.findall(";" + content_type)
+
+    charset = None
+    for param in params:
+        name, separator, value = param.partition("=")
+        if separator and name.strip().lower() == "charset":
+            charset = value.strip()
 
-    if "charset" in params:
-        return params["charset"].strip("'\"")
+    if charset is not None:
+        return charset.strip("'\"")
 
     if "text" in content_type:
         return "ISO-8859-1"
@@ -33,13 +45,16 @@ def get_encoding_from_headers(headers):
 def file_path_to_path(*paths: FilePath) -> pathlib.Path:
     """Convert a list of paths into a pathlib.Path."""
 
-    safe_paths: typing.List[typing.Union[str, os.PathLike]] = []
-    for path in paths:
-        if isinstance(path, bytes):
-            safe_paths.append(path.decode())
-        else:
-            safe_paths.append(path)
+    if len(paths) == 1:
+        path = paths[0]
+        if type(path) is str:
+            return pathlib.Path(path)
+        if type(path) is bytes:
+            return pathlib.Path(path.decode())
 
+    safe_paths: typing.List[typing.Union[str, os.PathLike]] = [
+        path.decode() if isinstance(path, bytes) else path for path in paths
+    ]
     return pathlib.Path(*safe_paths)
 
 
@@ -65,23 +80,28 @@ def safe_join(directory: FilePath, *paths: FilePath) -> pathlib.Path:
 
 
 def split_on_first(text: str, sep: str) -> typing.Tuple[str, str]:
-    point = text.find(sep)
-    if point == -1:
-        return text, text[:0]  # return bytes or str
-    return text[:point], text[point + len(sep) :]  # noqa: E203
+    head, _, tail = text.partition(sep)
+    return head, tail
 
 
+@functools.lru_cache(maxsize=None)
 def import_from_string(string: str):
-    module = __import__(string.split(".")[0])
-    for name in string.split(".")[1:]:
-        module = getattr(module, name)
-    return module
+    try:
+        return importlib.import_module(string)
+    except ModuleNotFoundError as error:
+        module_name, _, name = string.rpartition(".")
+        # the module that failed to import isn't part of the string
+        if not module_name or not string.startswith(error.name or string):
+            raise
+
+    return getattr(import_from_string(module_name), name)
 
 
 def address_to_str(address: typing.Tuple[str, int]) -> str:
     """Converts a ``(host, port)`` tuple into a ``host:port`` string."""
 
-    return "{}:{}".format(*address)
+    host, port = address
+    return f"{host}:{port}"
 
 
 def to_bytes(str_or_bytes: StrOrBytes, encoding="utf-8") -> bytes:
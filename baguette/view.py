@@ -46,9 +46,12 @@ class View:
             if hasattr(self, method.lower()):
                 self.methods.append(method)
 
+        self._handlers: typing.Dict[str, Handler] = {}
         self._methods_kwargs = {}
         for method in self.methods:
-            handler_signature = inspect.signature(getattr(self, method.lower()))
+            handler = getattr(self, method.lower())
+            self._handlers[method] = handler
+            handler_signature = inspect.signature(handler)
             self._methods_kwargs[method] = [
                 param.name
                 for param in handler_signature.parameters.values()
@@ -62,9 +65,9 @@ class View:
     async def dispatch(self, request: Request, **kwargs) -> Response:
         """Dispatch the request to the right method handler."""
 
-        if request.method not in self.methods:
+        handler: Handler = self._handlers.get(request.method)
+        if handler is None:
             raise MethodNotAllowed()
-        handler: Handler = getattr(self, request.method.lower())
 
         kwargs["request"] = request
         kwargs = {
@@ -30,11 +30,15 @@ author = "takos22"
 #
 # The short X.Y version.
 
+VERSION_REGEX = re.compile(r"__version__\s*=\s*['\"]([^'\"]*)['\"]")
+
 version = ""
 with open("../baguette/__init__.py") as f:
-    version = re.search(
-        r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", f.read(), re.MULTILINE
-    ).group(1)
+    for line in f:
+        match = VERSION_REGEX.match(line)
+        if match is not None:
+            version = match.group(1)
+            break
 
 # The full version, including alpha/beta/rc tags
 release = version
@@ -116,6 +120,8 @@ todo_include_todos = True
 
 # avoid confusion between section references
 autosectionlabel_prefix_document = True
+# only label the top level sections, deeper ones use explicit labels
+autosectionlabel_maxdepth = 2
 
 # pygments styles
 pygments_style = "sphinx"
@@ -1,3 +1,5 @@
+import itertools
+
 from baguette import Baguette, View
 from baguette.httpexceptions import BadRequest, NotFound
 from baguette.responses import EmptyResponse
@@ -6,8 +8,10 @@ app = Baguette(debug=True, error_response_type="json")
 
 API_VERSION = "1.0"
 REQUIRED_FIELDS = {"name", "email"}
+REQUIRED_FIELDS_TEXT = ", ".join(REQUIRED_FIELDS)
 
 users = {}  # TODO: use DB
+user_ids = itertools.count(1)
 # user: {"id": int, "name": str, "email": str}
 
 
@@ -18,8 +22,6 @@ async def index():
 
 @app.route("/users")
 class UserList(View):
-    id = 1
-
     async def get(self):
         return list(users.values())
 
@@ -32,19 +34,18 @@ class UserList(View):
         if not isinstance(user, dict):
             raise BadRequest(description="Dict required")
 
-        if REQUIRED_FIELDS - set(user.keys()) != set():
-            raise BadRequest(
-                description="Must include: " + ", ".join(self.REQUIRED_FIELDS)
-            )
+        if user.keys() ^ REQUIRED_FIELDS:
+            if REQUIRED_FIELDS - user.keys():
+                raise BadRequest(
+                    description="Must include: " + REQUIRED_FIELDS_TEXT
+                )
 
-        if set(user.keys()) - REQUIRED_FIELDS != set():
             raise BadRequest(
-                description="Must only include: " + ", ".join(REQUIRED_FIELDS)
+                description="Must only include: " + REQUIRED_FIELDS_TEXT
             )
 
-        user["id"] = self.id
+        user["id"] = next(user_ids)
         users[user["id"]] = user
-        self.id += 1
 
         return user
 
@@ -52,16 +53,16 @@ class UserList(View):
 @app.route("/users/<user_id:int>")
 class UserDetail(View):
     async def get(self, user_id: int):
-        if user_id not in users:
+        user = users.get(user_id)
+        if user is None:
             raise NotFound(description=f"No user with ID {user_id}")
 
-        return users[user_id]
+        return user
 
     async def delete(self, user_id: int):
-        if user_id not in users:
+        if users.pop(user_id, None) is None:
             raise NotFound(description=f"No user with ID {user_id}")
 
-        del users[user_id]
         return EmptyResponse()
 
 
@@ -1,4 +1,4 @@
-from baguette import Baguette, View
+from baguette import Baguette, HTMLResponse, View
 from baguette.httpexceptions import BadRequest
 
 app = Baguette(error_response_type="html")
@@ -36,7 +36,7 @@ FILE_FORM_HTML = """
 @app.route("/")
 class Form(View):
     async def get(self):
-        return FORM_HTML
+        return HTMLResponse(FORM_HTML)
 
     async def post(self, request):
         form = await request.form()
@@ -46,7 +46,7 @@ class Form(View):
 @app.route("/file")
 class FileForm(View):
     async def get(self):
-        return FILE_FORM_HTML
+        return HTMLResponse(FILE_FORM_HTML)
 
     async def post(self, request):
         form = await request.form()
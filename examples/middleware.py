@@ -12,12 +12,8 @@ class TimingMiddleware(Middleware):
     async def __call__(self, request):
         start_time = time.perf_counter()
         response = await self.next(request)
-        process_time = time.perf_counter() - start_time
-        logger.info(
-            "{0.method} {0.path}: {1}ms".format(
-                request, round(process_time * 1000, 2)
-            )
-        )
+        process_time = (time.perf_counter() - start_time) * 1000
+        logger.info("%s %s: %.2fms", request.method, request.path, process_time)
         return response
 
 
@@ -1,7 +1,9 @@
 import os
 import re
 
-from setuptools import setup
+from setuptools import find_packages, setup
+
+VERSION_REGEX = re.compile(r"__version__\s*=\s*['\"]([^'\"]*)['\"]")
 
 
 def get_version(package):
@@ -10,11 +12,11 @@ def get_version(package):
     path = os.path.join(package, "__init__.py")
     version = ""
     with open(path, "r", encoding="utf8") as init_py:
-        version = re.search(
-            r"^__version__\s*=\s*['\"]([^'\"]*)['\"]",
-            init_py.read(),
-            re.MULTILINE,
-        ).group(1)
+        for line in init_py:
+            match = VERSION_REGEX.match(line)
+            if match is not None:
+                version = match.group(1)
+                break
 
     if not version:
         raise RuntimeError(f"__version__ is not set in {path}")
@@ -22,16 +24,6 @@ def get_version(package):
     return version
 
 
-def get_packages(package):
-    """Return root package and all sub-packages."""
-
-    return [
-        dirpath
-        for dirpath, *_ in os.walk(package)
-        if os.path.exists(os.path.join(dirpath, "__init__.py"))
-    ]
-
-
 def get_long_description(filename: str = "README.rst"):
     """Return the README."""
 
@@ -63,7 +55,7 @@ setup(
     long_description_content_type="text/x-rst",
     author="takos22",
     author_email="takos2210@gmail.com",
-    packages=get_packages("baguette"),
+    packages=find_packages(include=["baguette", "baguette.*"]),
     python_requires=">=3.6",
     install_requires=get_requirements(),
     extras_require=extra_requires,
@@ -1,7 +1,11 @@
+import collections
+import functools
+
 import pytest
 
 from baguette.app import Baguette
 from baguette.headers import make_headers
+from baguette.httpexceptions import NotImplemented
 from baguette.request import Request
 
 
@@ -15,31 +19,69 @@ class Send:
 
 class Receive:
     def __init__(self, values: list = None):
-        self.values = values or []
+        self.values = collections.deque(values or [])
 
     async def __call__(self):
-        return self.values.pop(0)
+        return self.values.popleft()
+
+
+# shared by the tests that don't add routes or middlewares to the app
+@pytest.fixture(name="app", scope="session")
+def create_app_fixture():
+    return Baguette()
+
+
+DEFAULT_HEADERS = {
+    "server": "baguette",
+    "content-type": "text/plain; charset=utf-8",
+}
+HTTP_SCOPE_TEMPLATE = {
+    "type": "http",
+    "asgi": {"version": "3.0", "spec_version": "2.1"},
+    "http_version": "1.1",
+    "server": ("127.0.0.1", 8000),
+    "client": ("127.0.0.1", 9000),
+    "scheme": "http",
+    "root_path": "",
+}
+
+
+# app with routes for every kind of error, shared by the request handling tests
+@pytest.fixture(name="handler_app", scope="module")
+def create_handler_app_fixture():
+    app = Baguette(error_include_description=False)
+
+    @app.route("/")
+    async def index(request):
+        return await request.body()
+
+    @app.route("/user/<user_id:int>")
+    async def user(user_id: int):
+        return str(user_id)
+
+    @app.route("/notimplemented")
+    async def notimplemented():
+        raise NotImplemented()  # noqa: F901
+
+    @app.route("/error")
+    async def error():
+        raise Exception()
+
+    return app
 
 
 def create_http_scope(
     path: str = "/",
     method: str = "GET",
-    headers={"server": "baguette", "content-type": "text/plain; charset=utf-8"},
+    headers=DEFAULT_HEADERS,
     querystring: str = "a=b",
 ):
-    return {
-        "type": "http",
-        "asgi": {"version": "3.0", "spec_version": "2.1"},
-        "http_version": "1.1",
-        "server": ("127.0.0.1", 8000),
-        "client": ("127.0.0.1", 9000),
-        "scheme": "http",
-        "root_path": "",
-        "method": method.upper(),
-        "path": path,
-        "headers": make_headers(headers).raw(),
-        "query_string": querystring.encode("ascii"),
-    }
+    scope = HTTP_SCOPE_TEMPLATE.copy()
+    scope["method"] = method.upper()
+    scope["path"] = path
+    scope["headers"] = make_headers(headers).raw()
+    scope["query_string"] = querystring.encode("ascii")
+    return scope
 
 
 @pytest.fixture(name="http_scope")
@@ -50,13 +92,14 @@ def create_http_scope_fixture():
 def create_test_request(
     path: str = "/",
     method: str = "GET",
-    headers={"server": "baguette", "content-type": "text/plain; charset=utf-8"},
+    headers=DEFAULT_HEADERS,
     querystring: str = "a=b",
     body: str = "",
     json=None,
+    app: Baguette = None,
 ):
     request = Request(
-        Baguette(),
+        app or Baguette(),
         create_http_scope(
             path=path,
             method=method,
@@ -73,11 +116,12 @@ def create_test_request(
 
 
 @pytest.fixture(name="test_request")
-def create_test_request_fixture():
-    return create_test_request()
+def create_test_request_fixture(app):
+    return create_test_request(app=app)
 
 
 # modified verison of https://stackoverflow.com/a/9759329/12815996
+@functools.lru_cache(maxsize=None)
 def concreter(abcls):
     """Create a concrete class for testing from an ABC.
     >>> import abc
@@ -95,17 +139,21 @@ def concreter(abcls):
     if not hasattr(abcls, "__abstractmethods__"):
         return abcls
 
-    new_dict = abcls.__dict__.copy()
-    del new_dict["__abstractmethods__"]
+    # creates a new class that inherits the abstract methods as is, without
+    # marking the methods of abcls as concrete
+    concrete_class = type("dummy_concrete_" + abcls.__name__, (abcls,), {})
+    concrete_class.__abstractmethods__ = frozenset()
+    return concrete_class
+
+
+def assert_cached(obj, *names: str):
+    # cached attributes start as None, so hasattr would always pass
+    uncached = [name for name in names if getattr(obj, name) is None]
+    assert not uncached, "not cached: " + ", ".join(uncached)
 
-    for abstractmethod in abcls.__abstractmethods__:
-        method = abcls.__dict__[abstractmethod]
-        method.__isabstractmethod__ = False
-        new_dict[abstractmethod] = method
 
-    # creates a new class, with the overriden ABCs:
-    return type("dummy_concrete_" + abcls.__name__, (abcls,), new_dict)
+STRIP_TABLE = str.maketrans("", "", " \n")
 
 
 def strip(text: str) -> str:
-    return text.replace(" ", "").replace("\n", "")
+    return text.translate(STRIP_TABLE)
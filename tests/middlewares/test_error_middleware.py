@@ -1,7 +1,6 @@
 import pytest
 
 from baguette.app import Baguette
-from baguette.httpexceptions import NotImplemented
 
 from ..conftest import create_test_request
 
@@ -25,31 +24,14 @@ from ..conftest import create_test_request
     ],
 )
 async def test_error_middleware(
+    handler_app: Baguette,
     path: str,
     method: str,
     body: str,
     expected_response_body: str,
     expected_response_status_code: int,
 ):
-    app = Baguette(error_include_description=False)
-
-    @app.route("/")
-    async def index(request):
-        return await request.body()
-
-    @app.route("/user/<user_id:int>")
-    async def user(user_id: int):
-        return str(user_id)
-
-    @app.route("/notimplemented")
-    async def notimplemented():
-        raise NotImplemented()  # noqa: F901
-
-    @app.route("/error")
-    async def error():
-        raise Exception()
-
     request = create_test_request(path=path, method=method, body=body)
-    response = await app.handle_request(request)
+    response = await handler_app.handle_request(request)
     assert response.body == expected_response_body
     assert response.status_code == expected_response_status_code
@@ -1,14 +1,9 @@
-import asyncio
 import pathlib
-import threading
 
-import aiofiles
 import pytest
-import requests
 
 from baguette.app import Baguette
 from baguette.headers import Headers
-from baguette.httpexceptions import NotImplemented
 from baguette.middleware import Middleware
 from baguette.rendering import render
 from baguette.request import Request
@@ -161,57 +156,48 @@ def test_app_route(setup, expected_attributes: dict):
         ["/error", "GET", "", "Internal Server Error", 500],
         ["/nonexistent", "GET", "", "Not Found", 404],
     ],
+    ids=[
+        "index",
+        "method_not_allowed",
+        "converter",
+        "converter_error",
+        "converter_not_found",
+        "http_exception",
+        "exception",
+        "not_found",
+    ],
 )
 async def test_app_handle_request(
+    handler_app: Baguette,
     path: str,
     method: str,
     body: str,
     expected_response_body: str,
     expected_response_status_code: int,
 ):
-    app = Baguette(error_include_description=False)
-
-    @app.route("/")
-    async def index(request):
-        return await request.body()
-
-    @app.route("/user/<user_id:int>")
-    async def user(user_id: int):
-        return str(user_id)
-
-    @app.route("/notimplemented")
-    async def notimplemented():
-        raise NotImplemented()  # noqa: F901
-
-    @app.route("/error")
-    async def error():
-        raise Exception()
-
     request = create_test_request(path=path, method=method, body=body)
-    response = await app.handle_request(request)
+    response = await handler_app.handle_request(request)
     assert response.body == expected_response_body
     assert response.status_code == expected_response_status_code
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    ["scope", "receive", "expected_sent_values"],
+    ["scope", "received_values", "expected_sent_values"],
     [
         [
             create_http_scope(),
-            Receive(
-                [
-                    {
-                        "type": "http.request.body",
-                        "body": b"Hello, ",
-                        "more_body": True,
-                    },
-                    {
-                        "type": "http.request.body",
-                        "body": b"World!",
-                    },
-                ]
-            ),
+            [
+                {
+                    "type": "http.request.body",
+                    "body": b"Hello, ",
+                    "more_body": True,
+                },
+                {
+                    "type": "http.request.body",
+                    "body": b"World!",
+                },
+            ],
             [
                 {
                     "type": "http.response.start",
@@ -228,32 +214,33 @@ async def test_app_handle_request(
         ],
         [
             {"type": "lifespan"},
-            Receive(
-                [
-                    {"type": "lifespan.startup"},
-                    {"type": "lifespan.shutdown"},
-                ]
-            ),
+            [
+                {"type": "lifespan.startup"},
+                {"type": "lifespan.shutdown"},
+            ],
             [
                 {"type": "lifespan.startup.complete"},
                 {"type": "lifespan.shutdown.complete"},
             ],
         ],
     ],
+    ids=["http", "lifespan"],
 )
-async def test_app_call(scope, receive: Receive, expected_sent_values: list):
+async def test_app_call(
+    scope, received_values: list, expected_sent_values: list
+):
     app = Baguette()
 
     @app.route("/")
     async def index(request):
         return PlainTextResponse(await request.body())
 
+    # a new receive for every run, so that reruns don't get an empty one
+    receive = Receive(received_values.copy())
     send = Send()
     await app(scope, receive, send)
 
-    assert len(expected_sent_values) == len(send.values)
-    for message in send.values:
-        assert message == expected_sent_values.pop(0)
+    assert send.values == expected_sent_values
 
 
 @pytest.mark.asyncio
@@ -282,9 +269,7 @@ async def test_app_call_lifespan_error():
 
     await app(scope, receive, send)
 
-    assert len(expected_sent_values) == len(send.values)
-    for message in send.values:
-        assert message == expected_sent_values.pop(0)
+    assert send.values == expected_sent_values
 
 
 @pytest.mark.asyncio
@@ -299,6 +284,11 @@ async def test_app_call_error():
         await app(scope, receive, send)
 
 
+@pytest.fixture(name="static_client", scope="module")
+def create_static_client():
+    return TestClient(Baguette(static_directory="tests/static"))
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ["path", "file_path", "mimetype"],
@@ -312,14 +302,11 @@ async def test_app_call_error():
         ],
     ],
 )
-async def test_app_static(path, file_path, mimetype):
-    app = TestClient(Baguette(static_directory="tests/static"))
-
-    response: FileResponse = await app.get(path)
+async def test_app_static(static_client: TestClient, path, file_path, mimetype):
+    response: FileResponse = await static_client.get(path)
 
     path = pathlib.Path(file_path).resolve(strict=True)
-    async with aiofiles.open(path, "rb") as f:
-        content_length = len(await f.read())
+    content_length = path.stat().st_size
 
     assert isinstance(response, FileResponse)
     assert response.file_path == path
@@ -329,7 +316,8 @@ async def test_app_static(path, file_path, mimetype):
     assert int(response.headers["content-length"]) == content_length
 
 
-expected_html = """
+expected_html = strip(
+    """
 <!DOCTYPE html>
 <html lang="en">
     <head>
@@ -353,6 +341,7 @@ expected_html = """
         </div>
     </body>
 </html>"""
+)
 
 
 @pytest.mark.asyncio
@@ -369,7 +358,7 @@ async def test_app_render():
     app = TestClient(app)
 
     response: HTMLResponse = await app.get("/template")
-    assert strip(response.body) == strip(expected_html)
+    assert strip(response.body) == expected_html
 
 
 import time
@@ -383,19 +372,30 @@ class TimingMiddleware(Middleware):
         return response
 
 
-@pytest.mark.asyncio
-async def test_app_create_middleware():
-    app = Baguette(middlewares=[TimingMiddleware])
+@pytest.fixture(name="clock")
+def create_fake_clock(monkeypatch):
+    # the /long routes advance this clock instead of sleeping
+    clock = [0.0]
+    monkeypatch.setattr(time, "perf_counter", lambda: clock[0])
+    return clock
+
 
+def add_timing_routes(app: Baguette, clock: list):
     @app.route("/short")
     async def short():
         return ""
 
     @app.route("/long")
     async def long():
-        await asyncio.sleep(0.2)
+        clock[0] += 0.2
         return ""
 
+
+@pytest.mark.asyncio
+async def test_app_create_middleware(clock: list):
+    app = Baguette(middlewares=[TimingMiddleware])
+    add_timing_routes(app, clock)
+
     assert len(app.middlewares) == 3
     request = create_test_request(path="/short")
     response = await app.handle_request(request)
@@ -411,17 +411,9 @@ async def test_app_create_middleware():
 
 
 @pytest.mark.asyncio
-async def test_app_add_remove_middleware():
+async def test_app_add_remove_middleware(clock: list):
     app = Baguette()
-
-    @app.route("/short")
-    async def short():
-        return ""
-
-    @app.route("/long")
-    async def long():
-        await asyncio.sleep(0.2)
-        return ""
+    add_timing_routes(app, clock)
 
     assert len(app.middlewares) == 2
     app.add_middleware(TimingMiddleware)
@@ -444,17 +436,9 @@ async def test_app_add_remove_middleware():
 
 
 @pytest.mark.asyncio
-async def test_app_middleware():
+async def test_app_middleware(clock: list):
     app = Baguette()
-
-    @app.route("/short")
-    async def short():
-        return ""
-
-    @app.route("/long")
-    async def long():
-        await asyncio.sleep(0.2)
-        return ""
+    add_timing_routes(app, clock)
 
     assert len(app.middlewares) == 2
 
@@ -470,9 +454,9 @@ async def test_app_middleware():
 
     @app.middleware()
     async def timing_middleware(next_middleware, request: Request):
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await next_middleware(request)
-        process_time = time.time() - start_time
+        process_time = time.perf_counter() - start_time
         response.headers["X-time"] = str(process_time)
         return response
 
@@ -495,30 +479,33 @@ async def test_app_middleware():
     assert len(app.middlewares) == 2
 
 
-def test_app_run():
-    app = Baguette()
-
-    running = threading.Event()
-
-    async def set_running():
-        running.set()
+def test_app_run(monkeypatch):
+    # uvicorn is an optional dependency, only needed by this test
+    uvicorn = pytest.importorskip("uvicorn")
 
-    def do_request():
-        if not running.wait(10.0):
-            raise TimeoutError("App hasn't started after 10s")
-
-        requests.get("http://127.0.0.1:8080")
+    app = Baguette()
+    uvicorn_kwargs = []
 
-    request_thread = threading.Thread(target=do_request)
-    request_thread.start()
+    def run(asgi_app, **kwargs):
+        assert asgi_app is app
+        assert app.debug
+        assert app.default_headers["server"] == "baguette"
+        uvicorn_kwargs.append(kwargs)
 
+    monkeypatch.setattr(uvicorn, "run", run)
     app.run(
         host="127.0.0.1",
         port=8080,
         debug=True,
-        limit_max_requests=1,  # end after one request
-        callback_notify=set_running,
-        timeout_notify=1,  # set the running event every second
+        headers={"server": "baguette"},
+        limit_max_requests=1,
     )
 
-    request_thread.join()
+    assert len(uvicorn_kwargs) == 1
+    assert uvicorn_kwargs[0]["host"] == "127.0.0.1"
+    assert uvicorn_kwargs[0]["port"] == 8080
+    assert uvicorn_kwargs[0]["limit_max_requests"] == 1
+
+    # the app config is restored after running
+    assert not app.debug
+    assert "server" not in app.default_headers
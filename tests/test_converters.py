@@ -76,12 +76,14 @@ def test_converter(converter: Converter, string: str, expected):
         [PathConverter(), ""],
         # integer converters
         [IntegerConverter(), "text"],
+        [IntegerConverter(), ""],
         [IntegerConverter(), "+1"],
         [IntegerConverter(), "-1"],
         [IntegerConverter(min=1), "0"],
         [IntegerConverter(max=1), "2"],
         # float converters
         [FloatConverter(), "text"],
+        [FloatConverter(), ""],
         [FloatConverter(), "+1.0"],
         [FloatConverter(), "-1.0"],
         [FloatConverter(), "inf"],
@@ -42,6 +42,7 @@ def test_file_field(content, expected_text):
     ["filename", "content_type", "expected_content_type"],
     [
         ["", None, "application/octet-stream"],
+        [None, None, "application/octet-stream"],
         ["", "", "application/octet-stream"],
         ["text.txt", "", "text/plain"],
         ["text.txt", "text/html", "text/html"],
@@ -282,5 +282,5 @@ def test_error_response(
 
 def test_error_response_error():
     error = HTTPException(400)
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Bad response type"):
         responses.make_error_response(error, type_="nonexistent")
@@ -5,7 +5,8 @@ from baguette.rendering import Renderer, init, render
 
 from .conftest import strip
 
-expected_html = """
+expected_html = strip(
+    """
 <!DOCTYPE html>
 <html lang="en">
     <head>
@@ -29,16 +30,21 @@ expected_html = """
         </div>
     </body>
 </html>"""
+)
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    return Renderer("tests/templates")
 
 
 @pytest.mark.asyncio
-async def test_renderer():
-    renderer = Renderer("tests/templates")
+async def test_renderer(renderer: Renderer):
     html = await renderer.render(
         "index.html",
         paragraphs=["1st paragraph", "2nd paragraph"],
     )
-    assert strip(html) == strip(expected_html)
+    assert strip(html) == expected_html
 
 
 def test_init():
@@ -55,4 +61,4 @@ async def test_render():
         paragraphs=["1st paragraph", "2nd paragraph"],
         templates_directory="tests/templates",
     )
-    assert strip(html) == strip(expected_html)
+    assert strip(html) == expected_html
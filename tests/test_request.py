@@ -3,16 +3,16 @@ from urllib.parse import urlencode
 
 import pytest
 
-from baguette.app import Baguette
 from baguette.forms import Field, FileField, Form
+from baguette.headers import Headers
 from baguette.httpexceptions import BadRequest
 from baguette.request import Request
 
-from .conftest import Receive, create_http_scope
+from .conftest import Receive, assert_cached, create_http_scope
 
 
-def test_request_create(http_scope):
-    request = Request(Baguette(), http_scope, Receive())
+def test_request_create(app, http_scope):
+    request = Request(app, http_scope, Receive())
     assert request.http_version == "1.1"
     assert request.asgi_version == "3.0"
     assert request.headers["server"] == "baguette"
@@ -29,76 +29,79 @@ def test_request_create(http_scope):
 
 
 @pytest.mark.asyncio
-async def test_request_raw_body(http_scope):
-    receive = Receive(
-        [
-            {
-                "type": "http.request.body",
-                "body": b"Hello, ",
-                "more_body": True,
-            },
-            {
-                "type": "http.request.body",
-                "body": b"World!",
-            },
-        ]
-    )
-    request = Request(Baguette(), http_scope, receive)
+async def test_request_set_parsed_attributes(app, http_scope, receive: Receive):
+    request = Request(app, http_scope, receive)
+    request.headers = Headers(server="test")
+    request.content_type = "application/json"
+    request.encoding = "latin-1"
+    assert request.headers["server"] == "test"
+    assert request.content_type == "application/json"
+    assert request.encoding == "latin-1"
+    assert await request.body() == "Hello, World!"
+
+
+def test_request_empty_querystring(app):
+    request = Request(app, create_http_scope(querystring=""), Receive())
+    assert request.querystring == {}
+    request.querystring = {"a": ["b"]}
+    assert request.querystring == {"a": ["b"]}
+
+
+# Receive copies the messages, so they can be shared between tests
+hello_world_messages = [
+    {
+        "type": "http.request.body",
+        "body": b"Hello, ",
+        "more_body": True,
+    },
+    {
+        "type": "http.request.body",
+        "body": b"World!",
+    },
+]
+
+
+@pytest.fixture(name="receive")
+def create_receive_fixture():
+    return Receive(hello_world_messages)
+
+
+@pytest.mark.asyncio
+async def test_request_raw_body(app, http_scope, receive: Receive):
+    request = Request(app, http_scope, receive)
     assert await request.raw_body() == b"Hello, World!"
     assert len(receive.values) == 0
     # caching
-    assert hasattr(request, "_raw_body")
+    assert_cached(request, "_raw_body")
     assert await request.raw_body() == b"Hello, World!"
 
 
 @pytest.mark.asyncio
-async def test_request_body(http_scope):
-    receive = Receive(
-        [
-            {
-                "type": "http.request.body",
-                "body": b"Hello, ",
-                "more_body": True,
-            },
-            {
-                "type": "http.request.body",
-                "body": b"World!",
-            },
-        ]
-    )
-    request = Request(Baguette(), http_scope, receive)
+async def test_request_body(app, http_scope, receive: Receive):
+    request = Request(app, http_scope, receive)
     assert await request.body() == "Hello, World!"
     assert len(receive.values) == 0
     # caching
-    assert hasattr(request, "_raw_body")
-    assert hasattr(request, "_body")
+    assert_cached(request, "_raw_body", "_body")
     assert await request.body() == "Hello, World!"
 
 
+json_body = json.dumps({"message": "Hello, World!"}).encode("utf-8")
+
+
 @pytest.mark.asyncio
-async def test_request_json(http_scope):
-    receive = Receive(
-        [
-            {
-                "type": "http.request.body",
-                "body": json.dumps({"message": "Hello, World!"}).encode(
-                    "utf-8"
-                ),
-            }
-        ]
-    )
-    request = Request(Baguette(), http_scope, receive)
+async def test_request_json(app, http_scope):
+    receive = Receive([{"type": "http.request.body", "body": json_body}])
+    request = Request(app, http_scope, receive)
     assert await request.json() == {"message": "Hello, World!"}
     assert len(receive.values) == 0
     # caching
-    assert hasattr(request, "_raw_body")
-    assert hasattr(request, "_body")
-    assert hasattr(request, "_json")
+    assert_cached(request, "_raw_body", "_body", "_json")
     assert await request.json() == {"message": "Hello, World!"}
 
 
 @pytest.mark.asyncio
-async def test_request_json_error(http_scope):
+async def test_request_json_error(app, http_scope):
     receive = Receive(
         [
             {
@@ -107,13 +110,24 @@ async def test_request_json_error(http_scope):
             }
         ]
     )
-    request = Request(Baguette(), http_scope, receive)
+    request = Request(app, http_scope, receive)
     with pytest.raises(BadRequest):
         await request.json()
 
 
+def field_values(form: Form, attribute: str = "value"):
+    return {
+        field.name: getattr(field, attribute)
+        for field in form.fields.values()
+        if not field.is_file
+    }
+
+
+urlencoded_body = urlencode({"test": "test test"}).encode("utf-8")
+
+
 @pytest.mark.asyncio
-async def test_request_form_url_encoded():
+async def test_request_form_url_encoded(app):
     http_scope = create_http_scope(
         headers="content-type: application/x-www-form-urlencoded",
         querystring=urlencode({"test2": "test test test"}),
@@ -122,30 +136,22 @@ async def test_request_form_url_encoded():
         [
             {
                 "type": "http.request.body",
-                "body": urlencode({"test": "test test"}).encode("utf-8"),
+                "body": urlencoded_body,
             }
         ]
     )
-    request = Request(Baguette(), http_scope, receive)
-    assert {
-        field.name: field.value
-        for field in (await request.form()).fields.values()
-    } == {"test": "test test"}
+    request = Request(app, http_scope, receive)
+    assert field_values(await request.form()) == {"test": "test test"}
     assert len(receive.values) == 0
     # caching
-    assert hasattr(request, "_raw_body")
-    assert {
-        field.name: field.value
-        for field in (await request.form()).fields.values()
-    } == {"test": "test test"}
+    assert_cached(request, "_raw_body", "_form")
+    assert field_values(await request.form()) == {"test": "test test"}
 
     # include querystring
-    assert {
-        field.name: field.value
-        for field in (
-            await request.form(include_querystring=True)
-        ).fields.values()
-    } == {"test": "test test", "test2": "test test test"}
+    assert field_values(await request.form(include_querystring=True)) == {
+        "test": "test test",
+        "test2": "test test test",
+    }
 
 
 multipart_body = (
@@ -163,57 +169,60 @@ multipart_body = (
 )
 
 
+def body_chunks(body: bytes, chunk_size: int):
+    return [
+        {
+            "type": "http.request.body",
+            "body": body[index : index + chunk_size],  # noqa: E203
+            "more_body": index + chunk_size < len(body),
+        }
+        for index in range(0, len(body), chunk_size)
+    ]
+
+
 @pytest.mark.asyncio
-async def test_request_form_multipart():
+@pytest.mark.parametrize(
+    "chunk_size",
+    [len(multipart_body), 16, 1],
+    ids=["single", "16", "1"],
+)
+async def test_request_form_multipart(app, chunk_size: int):
     http_scope = create_http_scope(
         headers="content-type: multipart/form-data; boundary=abcd1234",
         querystring=urlencode({"test": "test test test"}),
     )
-    receive = Receive(
-        [
-            {
-                "type": "http.request.body",
-                "body": multipart_body,
-            }
-        ]
-    )
-    request = Request(Baguette(), http_scope, receive)
+    receive = Receive(body_chunks(multipart_body, chunk_size))
+    request = Request(app, http_scope, receive)
     form = await request.form()
-    assert {
-        field.name: field.value
-        for field in form.fields.values()
-        if not field.is_file
-    } == {"test": "test test", "another test": "another test test"}
+    assert field_values(form) == {
+        "test": "test test",
+        "another test": "another test test",
+    }
     assert {file.name: file.content for file in form.files.values()} == {
         "file": b'console.log("Hello, World!")'
     }
     assert len(receive.values) == 0
     # caching
-    assert hasattr(request, "_raw_body")
+    assert_cached(request, "_raw_body", "_form")
     form = await request.form()
-    assert {
-        field.name: field.value
-        for field in form.fields.values()
-        if not field.is_file
-    } == {"test": "test test", "another test": "another test test"}
+    assert field_values(form) == {
+        "test": "test test",
+        "another test": "another test test",
+    }
     assert {file.name: file.content for file in form.files.values()} == {
         "file": b'console.log("Hello, World!")'
     }
 
     # include querystring
     form = await request.form(include_querystring=True)
-    assert {
-        field.name: field.values
-        for field in form.fields.values()
-        if not field.is_file
-    } == {
+    assert field_values(form, attribute="values") == {
         "test": ["test test", "test test test"],
         "another test": ["another test test"],
     }
 
 
 @pytest.mark.asyncio
-async def test_request_form_error():
+async def test_request_form_error(app):
     http_scope = create_http_scope(
         headers="content-type: text/plain",
     )
@@ -225,8 +234,8 @@ async def test_request_form_error():
             }
         ]
     )
-    request = Request(Baguette(), http_scope, receive)
-    with pytest.raises(ValueError):
+    request = Request(app, http_scope, receive)
+    with pytest.raises(ValueError, match="Content-type 'text/plain'"):
         await request.form()
 
 
@@ -238,7 +247,7 @@ async def test_request_set_raw_body(test_request: Request):
 
 
 def test_request_set_raw_body_error(test_request: Request):
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="of type bytes"):
         test_request.set_raw_body("Hello, World!")
 
 
@@ -249,6 +258,7 @@ def test_request_set_raw_body_error(test_request: Request):
         ["Hello, World!", "Hello, World!", b"Hello, World!"],
         [b"Hello, World!", "Hello, World!", b"Hello, World!"],
     ],
+    ids=["str", "bytes"],
 )
 async def test_request_set_body(
     test_request: Request, body, expected_body, expected_raw_body
@@ -282,6 +292,7 @@ def test_request_set_body_error(test_request: Request):
             b'{"Hello":"World!"}',
         ],
     ],
+    ids=["str", "dict"],
 )
 async def test_request_set_json(
     test_request: Request, json, expected_json, expected_body, expected_raw_body
@@ -318,5 +329,5 @@ async def test_request_set_form(test_request: Request):
 
 
 def test_request_set_form_error(test_request: Request):
-    with pytest.raises(TypeError):
+    with pytest.raises(TypeError, match="of type Form"):
         test_request.set_form("Hello, World!")
@@ -2,7 +2,6 @@ import json
 import pathlib
 import re
 
-import aiofiles
 import pytest
 
 from baguette.headers import Headers
@@ -173,8 +172,7 @@ def test_file_response_create(file_path, mimetype, kwargs):
     response = FileResponse(file_path, **kwargs)
 
     path = pathlib.Path(file_path).resolve(strict=True)
-    with open(path, "rb") as f:
-        content_length = len(f.read())
+    content_length = path.stat().st_size
 
     assert response.file_path == path
     assert response.mimetype == mimetype
@@ -224,8 +222,7 @@ async def test_response_send():
 async def test_file_response_send():
     send = Send()
     response = FileResponse("tests/static/css/style.css", add_etags=False)
-    async with aiofiles.open("tests/static/css/style.css", "rb") as f:
-        content = await f.read()
+    content = pathlib.Path("tests/static/css/style.css").read_bytes()
 
     await response._send(send)
     assert send.values.pop(0) == {
@@ -3,6 +3,7 @@ import re
 import pytest
 
 from baguette.converters import (
+    Converter,
     FloatConverter,
     IntegerConverter,
     PathConverter,
@@ -153,6 +154,29 @@ def test_route4():
     assert route.convert("/test") == {"path": "test/test"}
 
 
+def test_route_convert_cache():
+    async def handler(id: int):
+        pass
+
+    route = Route(
+        path="/test/<id:int>",
+        name="test",
+        handler=handler,
+        methods=["GET"],
+        defaults={"id": 0},
+    )
+    kwargs = route.convert("/test/1")
+    assert kwargs == {"id": 1}
+    # callers can modify the returned kwargs without affecting the cache
+    kwargs["request"] = None
+    assert route.convert("/test/1") == {"id": 1}
+
+    # defaults are applied even when the conversion is cached
+    assert route.convert("/test") == {"id": 0}
+    route.defaults["id"] = 2
+    assert route.convert("/test") == {"id": 2}
+
+
 def test_router():
     async def handler(request):
         pass
@@ -206,3 +230,171 @@ def test_router():
     assert router.get("/user/1", "DELETE") == user_delete
     with pytest.raises(MethodNotAllowed):
         router.get("/user/1", "POST")
+
+
+def test_router_registration_order():
+    async def handler(request):
+        pass
+
+    router = Router()
+    user = router.add_route(
+        path="/user/<name>",
+        name="user",
+        handler=handler,
+        methods=["GET"],
+    )
+    me = router.add_route(
+        path="/user/me",
+        name="me",
+        handler=handler,
+        methods=["GET", "DELETE"],
+    )
+    index = router.add_route(
+        path="/",
+        name="index",
+        handler=handler,
+        methods=["GET"],
+    )
+
+    assert router.get("/user/me", "GET") == user
+    assert router.get("/user/me/", "DELETE") == me
+    assert router.get("/user/test", "GET") == user
+    assert router.get("/", "GET") == index
+    assert router.get("//", "GET") == index
+    with pytest.raises(MethodNotAllowed):
+        router.get("/user/test", "DELETE")
+    with pytest.raises(NotFound):
+        router.get("/user/me/test", "GET")
+
+
+def test_router_dynamic_routes():
+    async def handler(request):
+        pass
+
+    router = Router()
+    user = router.add_route(
+        path="/user/<user_id:int>",
+        name="user",
+        handler=handler,
+        methods=["GET"],
+    )
+    name = router.add_route(
+        path="/user/<name>",
+        name="name",
+        handler=handler,
+        methods=["GET", "DELETE"],
+    )
+    assert router.get("/user/1", "GET") == user
+    assert router.get("/user/1", "DELETE") == name
+    assert router.get("/user/test", "GET") == name
+    with pytest.raises(NotFound):
+        router.get("/post/1", "GET")
+
+    # the routes added after a lookup are matched too
+    post = router.add_route(
+        path="/post/<post_id:int>",
+        name="post",
+        handler=handler,
+        methods=["GET"],
+    )
+    assert router.get("/post/1", "GET") == post
+    with pytest.raises(MethodNotAllowed):
+        router.get("/post/1", "POST")
+
+
+class ColorConverter(Converter):
+    REGEX = r"(red|blue)"
+
+    def convert(self, string: str):
+        return string
+
+
+def test_router_converter_with_groups(monkeypatch):
+    monkeypatch.setitem(Route.PARAM_CONVERTERS, "color", ColorConverter)
+
+    async def handler(request):
+        pass
+
+    router = Router()
+    paint = router.add_route(
+        path="/paint/<c:color>", name="paint", handler=handler, methods=["GET"]
+    )
+    num = router.add_route(
+        path="/num/<n:int>", name="num", handler=handler, methods=["GET"]
+    )
+    x = router.add_route(
+        path="/x/<x>", name="x", handler=handler, methods=["GET"]
+    )
+    assert router.get("/paint/red", "GET") == paint
+    assert router.get("/num/3", "GET") == num
+    assert router.get("/x/hello", "GET") == x
+    with pytest.raises(NotFound):
+        router.get("/paint/green", "GET")
+
+
+def test_router_routes_removed():
+    async def handler(request):
+        pass
+
+    router = Router()
+    router.add_route(path="/a", name="a", handler=handler, methods=["GET"])
+    router.add_route(
+        path="/b/<id:int>", name="b", handler=handler, methods=["GET"]
+    )
+    assert router.get("/a", "GET").name == "a"
+    assert router.get("/b/1", "GET").name == "b"
+
+    router.routes.pop()
+    with pytest.raises(NotFound):
+        router.get("/b/1", "GET")
+    router.routes.pop()
+    with pytest.raises(NotFound):
+        router.get("/a", "GET")
+
+
+def test_router_route_path_changed():
+    async def handler(request):
+        pass
+
+    router = Router()
+    static = router.add_route(
+        path="/a", name="static", handler=handler, methods=["GET"]
+    )
+    dynamic = router.add_route(
+        path="/c/<id:int>", name="dynamic", handler=handler, methods=["GET"]
+    )
+    assert router.get("/a", "GET") == static
+    assert router.get("/c/1", "GET") == dynamic
+
+    static.path = "/b"
+    static.build_converters()
+    static.build_regex()
+    assert static.match("/b")
+    assert router.get("/b", "GET") == static
+    with pytest.raises(NotFound):
+        router.get("/a", "GET")
+
+    dynamic.path = "/d/<id:int>"
+    dynamic.build_converters()
+    dynamic.build_regex()
+    assert router.get("/d/1", "GET") == dynamic
+    with pytest.raises(NotFound):
+        router.get("/c/1", "GET")
+
+
+def test_router_routes_assigned():
+    async def handler(request):
+        pass
+
+    router = Router()
+    a = router.add_route(path="/a", name="a", handler=handler, methods=["GET"])
+    assert router.get("/a", "GET") == a
+
+    # building a route outside of the router keeps its index
+    b = Route(path="/b", name="b", handler=handler, methods=["GET"])
+    assert not router._index_is_stale
+
+    router.routes = [b]
+    assert router.get("/b", "GET") == b
+    with pytest.raises(NotFound):
+        router.get("/a", "GET")
@@ -1,3 +1,5 @@
+import operator
+
 import pytest
 
 from baguette.app import Baguette
@@ -78,7 +80,7 @@ async def test_test_client_prepare_request(test_client: Client):
     )
     expected_request = create_test_request(body="Hello, World!")
 
-    for attr in [
+    get_attributes = operator.attrgetter(
         "http_version",
         "asgi_version",
         "encoding",
@@ -89,8 +91,8 @@ async def test_test_client_prepare_request(test_client: Client):
         "querystring",
         "server",
         "client",
-    ]:
-        assert getattr(request, attr) == getattr(expected_request, attr)
+    )
+    assert get_attributes(request) == get_attributes(expected_request)
 
     assert (await request.json()) == {"b": "c"}
 
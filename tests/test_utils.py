@@ -8,6 +8,7 @@ from baguette.utils import (
     address_to_str,
     file_path_to_path,
     get_encoding_from_headers,
+    import_from_string,
     safe_join,
     split_on_first,
 )
@@ -21,6 +22,11 @@ from baguette.utils import (
         [Headers(("content-type", "text/plain; charset=utf-8")), "utf-8"],
         [Headers(("content-type", "text/plain; charset='utf-8'")), "utf-8"],
         [Headers(("content-type", 'text/plain; charset="utf-8"')), "utf-8"],
+        [
+            Headers(("content-type", 'application/json; foo="a;charset=x"')),
+            None,
+        ],
+        [Headers(("content-type", "text/html; charset=")), ""],
     ],
 )
 def test_get_encoding_from_headers(headers, encoding):
@@ -80,6 +86,28 @@ def test_split_on_first(text, sep, expected):
     assert split_on_first(text, sep) == expected
 
 
+@pytest.mark.parametrize(
+    ["string", "expected"],
+    [
+        ["pathlib", pathlib],
+        ["pathlib.Path", pathlib.Path],
+        ["baguette.headers.Headers", Headers],
+        ["baguette.headers.Headers.raw", Headers.raw],
+    ],
+)
+def test_import_from_string(string, expected):
+    assert import_from_string(string) is expected
+    # cached
+    assert import_from_string(string) is expected
+
+
+def test_import_from_string_error():
+    with pytest.raises(ModuleNotFoundError):
+        import_from_string("nonexistent.module")
+    with pytest.raises(AttributeError):
+        import_from_string("baguette.headers.nonexistent")
+
+
 @pytest.mark.parametrize(
     ["address", "expected"],
     [
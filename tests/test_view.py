@@ -1,13 +1,12 @@
 import pytest
 
-from baguette.app import Baguette
 from baguette.httpexceptions import MethodNotAllowed
 from baguette.responses import make_response
 from baguette.view import View
 
 
 @pytest.mark.asyncio
-async def test_view_create():
+async def test_view_create(app):
     class TestView(View):
         async def get(self, request):
             return "GET"
@@ -24,7 +23,7 @@ async def test_view_create():
         async def nonexistent_method(self, request):
             return "NONEXISTENT"
 
-    view = TestView(Baguette())
+    view = TestView(app)
     assert view.methods == ["GET", "POST", "PUT", "DELETE"]
     assert await view.get(None) == "GET"
     assert await view.post(None) == "POST"
@@ -34,7 +33,7 @@ async def test_view_create():
 
 
 @pytest.fixture(name="view")
-def create_view():
+def create_view(app):
     class TestView(View):
         async def get(self, request):
             return "GET"
@@ -48,7 +47,7 @@ def create_view():
         async def delete(self, request):
             return "DELETE"
 
-    return TestView(Baguette())
+    return TestView(app)
 
 
 @pytest.mark.asyncio